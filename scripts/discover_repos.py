@@ -1,18 +1,84 @@
 import yaml
+import copy
 import fnmatch
 import os
+import sys
 from pathlib import Path
 from dotenv import load_dotenv
 from github import Github, Auth
 from github.GithubException import GithubException
 
-# Load environment variables from .env file
+# Prefer the libyaml C bindings; fall back to the pure-Python loader if unavailable
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# .env file with environment variables (only read when a token is needed)
 env_path = Path(__file__).parent.parent / '.env'
-load_dotenv(env_path)
+
+# Parsed config cache: path -> (mtime, size, parsed data)
+_YAML_CACHE: dict[str, tuple[float, int, dict]] = {}
+
+
+def _load_yaml_cached(path):
+    """Load a YAML file, reusing the parsed result while its mtime and size are unchanged."""
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    cached = _YAML_CACHE.get(key)
+    if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        # Hand out a copy so callers mutating the config can't corrupt the cache
+        return copy.deepcopy(cached[2])
+
+    with open(key) as f:
+        data = yaml.load(f, Loader=SafeLoader)
+    _YAML_CACHE[key] = (st.st_mtime, st.st_size, data)
+    return copy.deepcopy(data)
+
+
+# Fetching every repo's languages up front only pays off when many repos may be
+# checked; below this max_repos_per_run, per-repo get_languages() calls are cheaper
+_LANGUAGE_BATCH_MIN_REPOS = 100
+
+# Language breakdown for all repos of an organization or user, 100 repos per page.
+# Only repos the owner owns, like the REST listing: the default affiliations also
+# include collaborator repos of other owners, whose names could shadow ours.
+_REPO_LANGUAGES_QUERY = """
+query($login: String!, $cursor: String) {
+  repositoryOwner(login: $login) {
+    repositories(first: 100, after: $cursor, ownerAffiliations: [OWNER]) {
+      pageInfo { hasNextPage endCursor }
+      nodes { name languages(first: 100) { nodes { name } } }
+    }
+  }
+}
+"""
+
+
+def _fetch_repo_languages(g, owner):
+    """
+    Map repo name -> language names for every repo of owner using paginated GraphQL queries.
+    
+    Returns an empty dict if the owner can't be resolved through GraphQL; raises
+    GithubException if a query fails.
+    """
+    languages_by_name = {}
+    cursor = None
+    while True:
+        _, data = g.requester.graphql_query(_REPO_LANGUAGES_QUERY, {"login": owner, "cursor": cursor})
+        repository_owner = (data.get("data") or {}).get("repositoryOwner")
+        if repository_owner is None:
+            return languages_by_name
+        repositories = repository_owner["repositories"]
+        for node in repositories["nodes"]:
+            languages_by_name[node["name"]] = [lang["name"] for lang in node["languages"]["nodes"]]
+        if not repositories["pageInfo"]["hasNextPage"]:
+            return languages_by_name
+        cursor = repositories["pageInfo"]["endCursor"]
+
 
 def discover_repos():
-    with open("config/repos.yaml") as f:
-        cfg = yaml.safe_load(f)
+    cfg = _load_yaml_cached("config/repos.yaml")
 
     mode = cfg["mode"]
 
@@ -29,17 +95,25 @@ def discover_repos():
         filters = org_config.get("filters", {})
         limits = org_config.get("limits", {})
         
-        # Get GitHub token from environment variable (can be set via .env file or environment)
+        # Get GitHub token from environment variable (can be set via .env file or environment);
+        # the .env file is only parsed when the environment doesn't already provide it
+        if not os.environ.get("GITHUB_TOKEN"):
+            load_dotenv(env_path)
         github_token = os.environ.get("GITHUB_TOKEN")
         if not github_token:
             raise ValueError("GITHUB_TOKEN is required for org_scan mode. Set it in .env file or as environment variable.")
         
-        # Initialize GitHub API client
+        # Initialize GitHub API client (100 repos per page, the API maximum; the
+        # paginated listing is lazy, so max_repos_per_run stops fetching early)
         auth = Auth.Token(github_token)
-        g = Github(auth=auth)
+        g = Github(auth=auth, per_page=100)
         
         repos = []
         max_repos = limits.get("max_repos_per_run")
+        # Batch language lookup (None = not fetched yet); skipped for small limits
+        repo_languages_by_name = None if not max_repos or max_repos >= _LANGUAGE_BATCH_MIN_REPOS else {}
+        # Lowercased once here rather than per repo
+        target_language = filters.get("language", "").lower()
         
         # Try to get repos from organization or user
         try:
@@ -66,14 +140,25 @@ def discover_repos():
                 continue
             
             # Filter by language
-            target_language = filters.get("language", "")
             if target_language:
-                repo_languages = repo.get_languages()
-                # GitHub API returns languages as a dict like {"Java": bytes, "Python": bytes}
-                # Check if target language (case-insensitive) exists in repo languages
-                repo_lang_names = [lang.lower() for lang in repo_languages.keys()]
-                if target_language.lower() not in repo_lang_names:
-                    continue
+                # Primary language is part of the list response - no extra API call
+                primary_language = repo.language
+                if not (primary_language and primary_language.lower() == target_language):
+                    # Otherwise check the full language breakdown, fetched for every
+                    # repo in batches of 100 instead of one get_languages() call per repo
+                    if repo_languages_by_name is None:
+                        try:
+                            repo_languages_by_name = _fetch_repo_languages(g, org_name)
+                        except GithubException as e:
+                            print(f"Warning: batch language lookup failed, checking languages per repository: {e}", file=sys.stderr)
+                            repo_languages_by_name = {}
+                    repo_languages = repo_languages_by_name.get(repo.name)
+                    if repo_languages is None:
+                        # GitHub API returns languages as a dict like {"Java": bytes, "Python": bytes}
+                        repo_languages = repo.get_languages().keys()
+                    # Check if target language (case-insensitive) exists in repo languages
+                    if not any(lang.lower() == target_language for lang in repo_languages):
+                        continue
             
             repos.append({
                 "name": repo.name,
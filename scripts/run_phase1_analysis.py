@@ -32,34 +32,398 @@ STATUS TRACKING:
 
 import subprocess
 import shutil
+import stat
 import sys
-import yaml
+import os
+import json
+import sqlite3
+import re
 import argparse
-from datetime import datetime
+import functools
+import threading
+import collections
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
 
-# Add scripts directory to path to import discover_repos
+# Top-level folders Transform writes into the cloned repo (moved to repos/<name>/analysis/)
+TRANSFORM_OUTPUT_FOLDERS = frozenset({
+    ".aws",
+    "Documentation",
+    ".atx",
+    "transform_output",
+    "analysis_output"
+})
+
+# Strong success indicators from Transform logs. The full messages
+#   "successfully completed with all exit criteria met"
+#   "comprehensive codebase analysis transformation has been successfully completed"
+# both contain one of these, so matching the shorter phrases alone is equivalent.
+LOG_SUCCESS_PHRASES = (
+    b'all exit criteria met',
+    b'successfully completed'
+)
+
+# Every log indicator as one case-insensitive alternation: each log line is scanned
+# once, without lowercasing a copy of it, and match.lastgroup names the indicator.
+# The validation-status pair counts only if both appear somewhere in the log.
+LOG_INDICATOR_RE = re.compile(
+    b'(?P<success>' + b'|'.join(re.escape(phrase) for phrase in LOG_SUCCESS_PHRASES) + b')'
+    b'|(?P<validation_status>validation status)'
+    b'|(?P<approved>approved)',
+    re.IGNORECASE
+)
+
+# Registry timestamps are recorded in UTC
+UTC = timezone.utc
+
+# Registry entry fields queried through the database (entries may carry more)
+REGISTRY_COLUMNS = ("repo_name", "git_url", "language", "analysis_status", "analysis_date", "notes")
+
+# Local SQLite working copy of the registry: every status transition is a single
+# indexed upsert. The `entry` column holds the complete entry as JSON, so fields
+# beyond REGISTRY_COLUMNS survive the round trip back to analysis_registry.yaml.
+REGISTRY_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS repos(
+    repo_name TEXT PRIMARY KEY,
+    git_url TEXT,
+    language TEXT,
+    analysis_status TEXT,
+    analysis_date TEXT,
+    notes TEXT,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS repos_analysis_status ON repos(analysis_status);
+CREATE TABLE IF NOT EXISTS meta(key TEXT PRIMARY KEY, value TEXT);
+"""
+
+# Bumped whenever REGISTRY_DB_SCHEMA changes; an older database is rebuilt from the YAML
+REGISTRY_DB_VERSION = 2
+
+REGISTRY_UPSERT_SQL = (
+    f"INSERT INTO repos({', '.join(REGISTRY_COLUMNS)}, entry) VALUES ({', '.join('?' * (len(REGISTRY_COLUMNS) + 1))}) "
+    "ON CONFLICT(repo_name) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in (*REGISTRY_COLUMNS[1:], "entry"))
+)
+
+# Add scripts directory to path to import discover_repos (imported in main(), since
+# it pulls in PyGithub and isn't needed by callers using the helpers below)
 scripts_dir = Path(__file__).parent
 sys.path.insert(0, str(scripts_dir))
-from discover_repos import discover_repos
 
 
-def load_registry(registry_path):
-    """Load the analysis registry from YAML file."""
-    if registry_path.exists():
+@functools.lru_cache(maxsize=None)
+def yaml_codec():
+    """
+    Import PyYAML on first use (it is only needed to read/write the registry).
+    
+    Returns: (yaml module, SafeLoader, SafeDumper)
+    """
+    import yaml
+    # Prefer the libyaml C bindings; fall back to the pure-Python loader/dumper if unavailable
+    try:
+        from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeLoader, SafeDumper
+    return yaml, SafeLoader, SafeDumper
+
+
+def index_registry(registry_data):
+    """
+    Attach in-memory bookkeeping to the registry (underscore keys, never persisted):
+    
+    - _index: repo_name -> entry
+    - _dirty: True once anything changed since the last load/save
+    """
+    repos = registry_data.setdefault("repos", [])
+    registry_data["_index"] = {r.get("repo_name"): r for r in repos}
+    registry_data["_dirty"] = False
+    return registry_data
+
+
+def registry_db_path(registry_path):
+    """SQLite working copy of the registry, kept next to the YAML (not committed)."""
+    return registry_path.with_suffix('.sqlite')
+
+
+def registry_file_stamp(registry_path):
+    """Identify the exact YAML file the database was last synced with."""
+    st = registry_path.stat()
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def open_registry_db(registry_path):
+    """
+    Open (creating if needed) the registry database.
+    
+    Autocommit mode, so each upsert is durable on its own; the connection is shared
+    by the worker threads, which only use it while holding the registry lock.
+    """
+    db = sqlite3.connect(registry_db_path(registry_path), isolation_level=None, check_same_thread=False)
+    if db.execute("PRAGMA user_version").fetchone()[0] != REGISTRY_DB_VERSION:
+        # The database is only a working copy, so an outdated one is simply
+        # dropped; read_registry() then re-imports the YAML
+        db.executescript("DROP TABLE IF EXISTS repos; DROP TABLE IF EXISTS meta;")
+        db.execute(f"PRAGMA user_version = {REGISTRY_DB_VERSION}")
+    db.executescript(REGISTRY_DB_SCHEMA)
+    return db
+
+
+def get_registry_meta(db, key):
+    row = db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def set_registry_meta(db, key, value):
+    db.execute(
+        "INSERT INTO meta(key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        (key, value)
+    )
+
+
+def upsert_registry_entry(db, entry):
+    """Write one registry entry to the database (insert or update by repo_name)."""
+    db.execute(
+        REGISTRY_UPSERT_SQL,
+        (*(entry.get(column) for column in REGISTRY_COLUMNS), json.dumps(entry, default=str))
+    )
+
+
+def read_registry(registry_path, db):
+    """
+    Read the analysis registry.
+    
+    Rows come from the database as long as the YAML is the file it last exported
+    or imported; otherwise (fresh checkout, YAML edited by hand or updated by git)
+    the YAML is parsed and the database is re-seeded from it.
+    
+    Top-level keys other than `repos` are kept in the meta table (in file order,
+    with a null placeholder marking where `repos` goes).
+    """
+    stamp = registry_file_stamp(registry_path) if registry_path.exists() else None
+    if stamp is not None and get_registry_meta(db, "yaml_stamp") == stamp:
+        registry_data = json.loads(get_registry_meta(db, "layout") or '{"repos": null}')
+        registry_data["repos"] = [json.loads(entry) for (entry,) in db.execute("SELECT entry FROM repos ORDER BY rowid")]
+        return index_registry(registry_data)
+
+    data = None
+    if stamp is not None:
         with open(registry_path, 'r') as f:
-            data = yaml.safe_load(f)
-            return data if data else {"repos": []}
-    return {"repos": []}
+            yaml, SafeLoader, _ = yaml_codec()
+            data = yaml.load(f, Loader=SafeLoader)
+    registry_data = index_registry(data if data else {"repos": []})
+    layout = {k: (None if k == "repos" else v) for k, v in registry_data.items() if not k.startswith("_")}
+
+    db.execute("BEGIN")
+    db.execute("DELETE FROM repos")
+    for entry in registry_data["repos"]:
+        upsert_registry_entry(db, entry)
+    set_registry_meta(db, "layout", json.dumps(layout, default=str))
+    set_registry_meta(db, "yaml_stamp", stamp)
+    db.execute("COMMIT")
+    return registry_data
+
+
+def load_registry(registry_path):
+    """
+    Load the analysis registry backed by its database (registry_data["_db"]).
+    
+    Repos still marked running were cut off by an interrupted run, so they are
+    annotated here (they are picked up again like any other unfinished repo).
+    """
+    db = open_registry_db(registry_path)
+    registry_data = read_registry(registry_path, db)
+    registry_data["_db"] = db
+    
+    interrupted_note = "Previous run was interrupted during analysis"
+    for entry in list(registry_data["repos"]):
+        if entry.get("analysis_status") == "running" and entry.get("notes") != interrupted_note:
+            update_registry_entry(
+                registry_data,
+                entry["repo_name"],
+                entry.get("git_url"),
+                "running",
+                notes=interrupted_note,
+                now=entry.get("analysis_date")
+            )
+    
+    return registry_data
+
+
+def write_atomic(path, dump):
+    """Write a file through a temp file + os.replace() so readers never see a partial write."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w') as f:
+        dump(f)
+    os.replace(tmp_path, path)
 
 
 def save_registry(registry_path, registry_data):
-    """Save the analysis registry to YAML file."""
-    with open(registry_path, 'w') as f:
-        yaml.dump(registry_data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    """
+    Export the analysis registry to its YAML file.
+    
+    The database already holds every change; the YAML is the committed copy.
+    """
+    # Nothing changed since the YAML was last exported - nothing to do
+    if not registry_data.get("_dirty") and registry_path.exists():
+        return
 
+    # In-memory bookkeeping is derived data - keep it out of the file
+    persisted = {k: v for k, v in registry_data.items() if not k.startswith("_")}
+    yaml, _, SafeDumper = yaml_codec()
+    write_atomic(
+        registry_path,
+        lambda f: yaml.dump(persisted, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    )
+    registry_data["_dirty"] = False
 
-def check_transform_success(clone_path, log_file_path):
+    # Mark the database as in sync with the file just written
+    db = registry_data.get("_db")
+    if db is not None:
+        set_registry_meta(db, "yaml_stamp", registry_file_stamp(registry_path))
+
+
+def remove_tree(path):
+    """
+    Delete a directory tree, fixing permissions if needed.
+    
+    On POSIX a single `rm -rf` runs first: its C walker beats shutil.rmtree on
+    clones with tens of thousands of files. shutil.rmtree, chmod'ing and retrying
+    only the entries it cannot delete, is the fallback and the only path on Windows.
+    
+    A missing path is a no-op, so callers don't need a separate exists() check.
+    """
+    if os.name == "posix":
+        result = subprocess.run(["rm", "-rf", "--", str(path)], stderr=subprocess.DEVNULL)
+        if result.returncode == 0:
+            return
+    
+    root = str(path)
+    
+    def rmtree(tree):
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(tree, onexc=chmod_and_retry)
+        else:
+            shutil.rmtree(tree, onerror=chmod_and_retry)
+    
+    def chmod_and_retry(func, failed_path, _exc):
+        # Already gone, e.g. removed by the recursive retry below
+        if not os.path.lexists(failed_path):
+            return
+        # Only the entries that actually fail get chmod'ed (no upfront walk of the
+        # whole tree). Deleting an entry also needs write access to its directory.
+        if failed_path != root:
+            os.chmod(os.path.dirname(failed_path), stat.S_IRWXU)
+        os.chmod(failed_path, stat.S_IRWXU)
+        if func in (os.unlink, os.remove, os.rmdir):
+            func(failed_path)
+        else:
+            # Opening or listing an unreadable directory failed (os.open, os.scandir,
+            # os.lstat, ...): now that it is accessible, remove it with its contents
+            rmtree(failed_path)
+    
+    try:
+        rmtree(path)
+    except FileNotFoundError:
+        return
+
+
+def copy_file_fast(src, dst):
+    """
+    Drop-in replacement for shutil.copy2 that copies file data in-kernel.
+    
+    Uses os.copy_file_range (Linux), which avoids user-space buffers and is a
+    reflink on copy-on-write filesystems; falls back to shutil.copy2 elsewhere.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    pass
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            # Unsupported by this kernel/filesystem pair - use the portable path
+            pass
+    return shutil.copy2(src, dst)
+
+
+def move_output(src, dst, is_dir):
+    """
+    Move a Transform output folder or file out of the clone, replacing any
+    output left at dst by a previous run.
+    
+    tmp/ and repos/ normally share a filesystem, so this is a metadata-only
+    os.rename. Across filesystems it falls back to copying: GNU
+    `cp --reflink=auto` first (C tree walk, shared extents on copy-on-write
+    filesystems), then shutil.copytree with copy_file_fast when cp is missing
+    or fails (e.g. non-GNU cp, Windows). The clone is deleted afterwards anyway.
+    
+    Symlinks are kept as links on every path, as a rename would keep them.
+    """
+    # Clear the previous run's output so the rename has a free target
+    if is_dir:
+        remove_tree(dst)
+    else:
+        Path(dst).unlink(missing_ok=True)
+    
+    try:
+        os.rename(src, dst)
+        return
+    except OSError:
+        pass
+    
+    if os.path.islink(src):
+        os.symlink(os.readlink(src), dst)
+        return
+    
+    if os.name == "posix":
+        if is_dir:
+            os.makedirs(dst, exist_ok=True)
+            # "src/." copies the folder's contents into dst, like dirs_exist_ok=True
+            sources = [os.path.join(src, ".")]
+        else:
+            sources = [src]
+        # -P copies symlinks as links and mode/timestamps are kept, matching copytree + copy2
+        result = subprocess.run(
+            ["cp", "-RP", "--preserve=mode,timestamps", "--reflink=auto", "--", *sources, str(dst)],
+            stderr=subprocess.DEVNULL
+        )
+        if result.returncode == 0:
+            return
+    
+    if is_dir:
+        shutil.copytree(src, dst, symlinks=True, dirs_exist_ok=True, copy_function=copy_file_fast)
+    else:
+        copy_file_fast(src, dst)
+
+
+def scan_outputs(clone_path):
+    """
+    Read the clone's top-level directory once for both success detection and collection.
+    
+    Returns: (names of TRANSFORM_OUTPUT_FOLDERS present, DirEntry list of outputs to
+    collect), or (None, []) when the clone directory doesn't exist.
+    """
+    found = set()
+    to_collect = []
+    try:
+        # DirEntry objects carry the file type from the directory read, so a later
+        # is_dir() needs no extra stat per entry
+        with os.scandir(clone_path) as entries:
+            for entry in entries:
+                if entry.name == ".git":
+                    continue
+                if entry.name in TRANSFORM_OUTPUT_FOLDERS:
+                    found.add(entry.name)
+                if entry.name in TRANSFORM_OUTPUT_FOLDERS or entry.name.startswith(".aws"):
+                    to_collect.append(entry)
+    except FileNotFoundError:
+        return None, []
+    return found, to_collect
+
+
+def check_transform_success(found_outputs, log_file_path):
     """
     OUTPUT-AWARE success detection: Check both files and logs.
     
@@ -67,6 +431,10 @@ def check_transform_success(clone_path, log_file_path):
     - Log file contains "successfully completed with all exit criteria met"
     - Multiple output folders exist (at least 2, including Documentation)
     
+    found_outputs: output folder names present in the clone, from scan_outputs()
+    (None if the clone is missing).
+    log_file_path: this run's Transform log, or None if Transform never started.
+    
     Returns: (is_success, confidence, details_dict)
     """
     results = {
@@ -76,48 +444,45 @@ def check_transform_success(clone_path, log_file_path):
         'log_validation_status': False
     }
     
-    # Required output folders for Transform analysis
+    # Required output folders for Transform analysis (in reporting order)
     required_outputs = [
-        ("Documentation", "Documentation"),
-        (".aws", ".aws"),
-        (".atx", ".atx"),
-        ("transform_output", "transform_output"),
-        ("analysis_output", "analysis_output")
+        "Documentation",
+        ".aws",
+        ".atx",
+        "transform_output",
+        "analysis_output"
     ]
     
     # Check for output folders
-    if clone_path.exists():
-        for name, folder_name in required_outputs:
-            full_path = clone_path / folder_name
-            if full_path.exists():
+    if found_outputs is not None:
+        for name in required_outputs:
+            if name in found_outputs:
                 results['outputs_found'].append(name)
             else:
                 results['outputs_missing'].append(name)
     
-    # Check log file for success indicators
-    if log_file_path.exists():
+    # Check log file for success indicators. Transform logs can be huge, so stream
+    # them line by line (bytes, no decode) and stop once every flag is settled.
+    if log_file_path is not None and log_file_path.exists():
         try:
-            with open(log_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                log_content = f.read()
-            
-            # Strong success indicators from Transform logs
-            success_phrases = [
-                'successfully completed with all exit criteria met',
-                'comprehensive codebase analysis transformation has been successfully completed',
-                'successfully completed',
-                'all exit criteria met'
-            ]
-            
-            # Check if the definitive success message exists
-            log_lower = log_content.lower()
-            for phrase in success_phrases:
-                if phrase in log_lower:
-                    results['log_success_message'] = True
-                    break
+            seen_validation_status = False
+            seen_approved = False
+            with open(log_file_path, 'rb') as f:
+                for line in f:
+                    # One pass per line finds every indicator it contains
+                    for match in LOG_INDICATOR_RE.finditer(line):
+                        if match.lastgroup == 'validation_status':
+                            seen_validation_status = True
+                        elif match.lastgroup == 'approved':
+                            seen_approved = True
+                        else:
+                            # The definitive success message exists
+                            results['log_success_message'] = True
+                    
+                    if results['log_success_message'] and seen_validation_status and seen_approved:
+                        break
             
-            # Also check for validation status
-            if 'validation status' in log_lower and 'approved' in log_lower:
-                results['log_validation_status'] = True
+            results['log_validation_status'] = seen_validation_status and seen_approved
                 
         except Exception:
             pass
@@ -144,20 +509,30 @@ def check_transform_success(clone_path, log_file_path):
     return is_success, confidence, results
 
 
-def update_registry_entry(registry_data, repo_name, git_url, status, language="unknown", notes=None):
+def utc_timestamp():
+    """Current UTC time as an ISO 8601 string with seconds precision (registry analysis_date)."""
+    return datetime.now(UTC).isoformat(timespec='seconds')
+
+
+def update_registry_entry(registry_data, repo_name, git_url, status, language="unknown", notes=None, now=None):
     """
     Update or create an entry in the registry.
     
     Valid statuses: pending, running, analyzed, failed
+    
+    now: ISO timestamp to record; pass one shared value when updating many repos
+    in the same transition (defaults to the current UTC time).
     """
+    if now is None:
+        now = utc_timestamp()
     repos = registry_data.setdefault("repos", [])
+    if "_index" not in registry_data:
+        index_registry(registry_data)
+    index = registry_data["_index"]
+    registry_data["_dirty"] = True
     
-    # Find existing entry
-    entry = None
-    for repo in repos:
-        if repo.get("repo_name") == repo_name:
-            entry = repo
-            break
+    # Find existing entry (O(1) via the name index)
+    entry = index.get(repo_name)
     
     # Create new entry if not found
     if entry is None:
@@ -166,15 +541,16 @@ def update_registry_entry(registry_data, repo_name, git_url, status, language="u
             "git_url": git_url,
             "language": language,
             "analysis_status": status,
-            "analysis_date": datetime.now().isoformat(),
+            "analysis_date": now,
         }
         if notes:
             entry["notes"] = notes
         repos.append(entry)
+        index[repo_name] = entry
     else:
         # Update existing entry
         entry["analysis_status"] = status
-        entry["analysis_date"] = datetime.now().isoformat()
+        entry["analysis_date"] = now
         if language != "unknown":
             entry["language"] = language
         if notes:
@@ -183,9 +559,251 @@ def update_registry_entry(registry_data, repo_name, git_url, status, language="u
             # Clear notes when successfully analyzed
             entry.pop("notes", None)
     
+    db = registry_data.get("_db")
+    if db is not None:
+        upsert_registry_entry(db, entry)
+    
     return registry_data
 
 
+def start_clone(repo_url, clone_path):
+    """Start cloning a repository in the background; returns the git Popen."""
+    # Clean up any existing clone directory from previous runs
+    remove_tree(clone_path)
+    
+    # Transform only reads the working tree at HEAD, so skip history, other
+    # branches, tags and up-front blob download. Protocol v2 (default since git
+    # 2.26) only advertises the refs we ask for; pin it for older runners.
+    # .git is kept (Transform runs against a git working tree), but an empty
+    # template leaves out the sample hooks and other files nobody reads.
+    return subprocess.Popen(
+        [
+            "git", "-c", "protocol.version=2", "clone",
+            "--template=",
+            "--depth=1",
+            "--filter=blob:none",
+            "--single-branch",
+            "--no-tags",
+            repo_url, str(clone_path)
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        # Never block a worker on a credential prompt - fail the clone instead
+        env={**os.environ, "GIT_TERMINAL_PROMPT": "0", "GIT_ASKPASS": "true"}
+    )
+
+
+class PipelinedCloner:
+    """
+    Keeps `git clone` one repository ahead of the analysis workers.
+    
+    Each time a worker picks up a repo, the clone of the next queued repo is
+    started in the background, so network-bound cloning overlaps with the
+    CPU-bound Transform run instead of following it.
+    """
+    
+    def __init__(self, repos, tmp_dir):
+        self.tmp_dir = tmp_dir
+        self._queued = collections.deque(repos)  # clone not started yet
+        self._in_flight = {}                     # repo_name -> Future resolving to the git Popen
+        self._lock = threading.Lock()
+    
+    def _start(self, repo):
+        return start_clone(repo["git_url"], self.tmp_dir / repo["name"])
+    
+    def clone(self, repo):
+        """Wait for repo's clone (starting it now if it wasn't prefetched) and prefetch the next one."""
+        # Only the queue bookkeeping happens under the lock: starting a clone first
+        # removes any stale tree, which must not hold up the other workers
+        with self._lock:
+            pending = self._in_flight.pop(repo["name"], None)
+            if pending is None:
+                self._queued.remove(repo)
+            prefetch = self._queued.popleft() if self._queued else None
+            if prefetch is not None:
+                prefetched = self._in_flight[prefetch["name"]] = Future()
+        
+        try:
+            process = pending.result() if pending is not None else self._start(repo)
+        finally:
+            # Always resolve the prefetch, or the worker waiting on it would hang
+            if prefetch is not None:
+                try:
+                    prefetched.set_result(self._start(prefetch))
+                except Exception as e:
+                    # Surfaces in the worker that picks up the prefetched repo
+                    prefetched.set_exception(e)
+        
+        stdout, stderr = process.communicate()
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, process.args, stdout, stderr)
+
+
+def process_repo(repo, tmp_dir, repos_dir, registry_path, registry_data, registry_lock, cloner):
+    """
+    Clone, analyze, collect outputs for and clean up a single repository.
+    
+    Safe to run concurrently: the registry is the only shared state and is
+    only mutated while holding registry_lock.
+    
+    Returns: (repo_name, status, notes)
+    """
+    repo_name = repo["name"]
+    repo_url = repo["git_url"]
+    
+    print(f"\n{'='*60}")
+    print(f"Processing repository: {repo_name}")
+    print(f"{'='*60}")
+    
+    # Clone location in tmp directory
+    clone_path = tmp_dir / repo_name
+    
+    # Output location for analysis results
+    analysis_output_dir = repos_dir / repo_name / "analysis"
+    if not analysis_output_dir.exists():
+        analysis_output_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Log file for Transform output (defined up front so the finally block can always check it)
+    log_file_path = repos_dir / f"{repo_name}_transform.log"
+    # Set once atx is launched: until then the log on disk is from an earlier run
+    atx_started = False
+    
+    try:
+        # Clone the repository (usually already started in the background by the cloner)
+        print(f"\nCloning {repo_url} to {clone_path}")
+        cloner.clone(repo)
+        print(f"Repository cloned successfully")
+        
+        # Mark repository as running before Transform execution (recorded in the
+        # registry database; the YAML is written once the repo finishes)
+        with registry_lock:
+            update_registry_entry(
+                registry_data,
+                repo_name,
+                repo_url,
+                "running",
+                language="unknown"
+            )
+        
+        # Run Transform analysis in non-interactive mode
+        # EXECUTION-PLANE: This is the heavy Transform execution (stable-runner only)
+        transformation_name = "AWS/early-access-comprehensive-codebase-analysis"
+        print(f"\nRunning Transform analysis on {repo_name}")
+        print(f"Using transformation: {transformation_name}")
+        
+        print(f"Streaming output to {log_file_path.name}...")
+        
+        # Stream output directly to disk (bypasses shell pipe buffer). The child
+        # inherits the raw fd and writes to it directly, so Python never touches the
+        # bytes: open unbuffered in binary mode (no text layer, no unused buffer).
+        atx_started = True
+        with open(log_file_path, "wb", buffering=0) as log_file:
+            subprocess.run(
+                [
+                    "atx", "custom", "def", "exec",
+                    "-n", transformation_name,
+                    "-p", str(clone_path),
+                    "-x",  # Non-interactive mode
+                    "-t"   # Trust all tools
+                ],
+                check=True,
+                cwd=str(clone_path),
+                stdout=log_file,          # Direct stream to disk (no RAM buffer)
+                stderr=subprocess.STDOUT  # Merge errors into same file
+            )
+        
+        print(f"Transform analysis completed. Logs saved to {log_file_path.name}")
+        transform_succeeded = True
+        
+    except subprocess.CalledProcessError:
+        # Transform process exited with error - but may have generated output
+        # Check for outputs before marking as failed (output-aware, not exit-code-only)
+        transform_succeeded = False
+        print(f"\nTransform process exited with error. Checking for generated output...", file=sys.stderr)
+    except Exception as e:
+        # Unexpected error - check for outputs anyway
+        transform_succeeded = False
+        print(f"\nUnexpected error during Transform execution: {e}. Checking for generated output...", file=sys.stderr)
+        
+    finally:
+        # OUTPUT-AWARE: Check for success using multiple indicators (logs + files)
+        # This runs regardless of process exit code - always check for outputs
+        # One directory read feeds both the success check and the output collection
+        found_outputs, outputs = scan_outputs(clone_path)
+        is_success, confidence, success_details = check_transform_success(
+            found_outputs, log_file_path if atx_started else None
+        )
+        
+        # Move ALL Transform-generated output out before cleanup (always run, even on errors)
+        copied_count = 0
+        if found_outputs is not None:
+            print(f"\nCollecting Transform-generated output...")
+            
+            # Usually a single rename per folder, so there is nothing to gain from parallelism
+            for entry in outputs:
+                try:
+                    move_output(entry.path, analysis_output_dir / entry.name, entry.is_dir())
+                    copied_count += 1
+                    print(f"Collected {entry.name}/")
+                except Exception as e:
+                    print(f"Warning: Could not collect {entry.name}: {e}", file=sys.stderr)
+            
+            if copied_count == 0:
+                print(f"Warning: No Transform output folders found.")
+        
+        # Determine final status based on outputs + logs, NOT just exit code
+        if is_success:
+            # Analysis succeeded (determined by outputs/logs, even if process errored)
+            output_list = ', '.join(success_details['outputs_found']) if success_details['outputs_found'] else 'none'
+            notes_parts = [f"Analysis completed (confidence: {confidence}). Outputs: {output_list}"]
+            
+            if success_details['log_success_message']:
+                notes_parts.append("Log confirms successful completion")
+            if not transform_succeeded:
+                notes_parts.append("Process exit code indicated error, but outputs confirm success")
+            
+            status = "analyzed"
+            notes = " | ".join(notes_parts)
+            print(f"\n✅ Analysis succeeded: Outputs validated (exit code ignored due to successful completion)")
+        elif transform_succeeded:
+            # Process succeeded but outputs don't meet success criteria
+            status = "analyzed"
+            notes = f"Process completed but limited outputs found. Outputs: {', '.join(success_details['outputs_found']) or 'none'}"
+            print(f"\n⚠️  Analysis completed with limited outputs")
+        else:
+            # Real failure: no outputs and process failed
+            missing_outputs = ', '.join(success_details['outputs_missing']) if success_details['outputs_missing'] else 'all'
+            status = "failed"
+            notes = f"Transform execution failed. Missing outputs: {missing_outputs}. Check {repos_dir.name}/{repo_name}_transform.log"
+            print(f"\n❌ Error: Failed to process {repo_name}. Check {repos_dir.name}/{repo_name}_transform.log", file=sys.stderr)
+        
+        # Delete the cloned repository after copying (always run cleanup)
+        if clone_path.exists():
+            print(f"\nDeleting cloned repository at {clone_path}")
+            try:
+                remove_tree(clone_path)
+                print(f"Cleanup complete")
+            except (PermissionError, OSError) as e:
+                print(f"Warning: Could not fully delete {clone_path}: {e}", file=sys.stderr)
+                print(f"Cleanup partial - some files may remain")
+        
+        with registry_lock:
+            update_registry_entry(
+                registry_data,
+                repo_name,
+                repo_url,
+                status,
+                language="unknown",
+                notes=notes
+            )
+            # Persist the terminal status right away, so a cancelled or killed run
+            # never loses repos it already finished
+            save_registry(registry_path, registry_data)
+    
+    return repo_name, status, notes
+
+
 def main():
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description='Run Phase 1 analysis on repositories')
@@ -194,7 +812,19 @@ def main():
         action='store_true',
         help='Force re-analysis of repositories already marked as analyzed'
     )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Number of repositories to process concurrently (default: $PHASE1_PARALLEL or 4)'
+    )
     args = parser.parse_args()
+    if args.jobs is None:
+        # An unset or empty PHASE1_PARALLEL means the default
+        try:
+            args.jobs = int(os.environ.get("PHASE1_PARALLEL") or 4)
+        except ValueError:
+            parser.error(f"PHASE1_PARALLEL must be an integer, got {os.environ['PHASE1_PARALLEL']!r}")
     
     # Get the project root directory (parent of scripts/)
     project_root = Path(__file__).parent.parent
@@ -212,34 +842,29 @@ def main():
     registry_data = load_registry(registry_path)
     
     # Discover repositories to analyze
+    from discover_repos import discover_repos
     discovered_repos = discover_repos()
     
-    # Filter repos based on registry status (idempotent by default)
-    repos_to_analyze = []
-    skipped_repos = []
+    # Filter repos based on registry status (idempotent by default): one indexed
+    # query for analyzed repos, then set lookups per discovered repo
+    db = registry_data["_db"]
+    analyzed_names = {
+        name for (name,) in db.execute("SELECT repo_name FROM repos WHERE analysis_status = 'analyzed'")
+    }
+    previously_analyzed = [repo["name"] for repo in discovered_repos if repo["name"] in analyzed_names]
     
-    for repo in discovered_repos:
-        repo_name = repo["name"]
-        
-        # Check if repo exists in registry
-        existing_entry = None
-        for reg_repo in registry_data.get("repos", []):
-            if reg_repo.get("repo_name") == repo_name:
-                existing_entry = reg_repo
-                break
-        
-        # Skip repos already analyzed (unless --force)
-        if existing_entry and existing_entry.get("analysis_status") == "analyzed":
-            if args.force:
-                # Force re-analysis: allow analyzed → pending
-                repos_to_analyze.append(repo)
-                print(f"Force re-analysis enabled for {repo_name} (previously analyzed)")
-            else:
-                skipped_repos.append(repo_name)
-                print(f"Skipping {repo_name} (already analyzed). Use --force to re-analyze.")
-        else:
-            # New repo or repo with other status (pending, running, failed) - include it
-            repos_to_analyze.append(repo)
+    if args.force:
+        # Force re-analysis: allow analyzed → pending
+        repos_to_analyze = list(discovered_repos)
+        skipped_repos = []
+        for repo_name in previously_analyzed:
+            print(f"Force re-analysis enabled for {repo_name} (previously analyzed)")
+    else:
+        # New repos or repos with other status (pending, running, failed) are included
+        repos_to_analyze = [repo for repo in discovered_repos if repo["name"] not in analyzed_names]
+        skipped_repos = previously_analyzed
+        for repo_name in skipped_repos:
+            print(f"Skipping {repo_name} (already analyzed). Use --force to re-analyze.")
     
     print(f"\nFound {len(discovered_repos)} repository(ies) to check")
     print(f"  - {len(repos_to_analyze)} repository(ies) to analyze")
@@ -250,210 +875,52 @@ def main():
         print("\nNo repositories to analyze. All discovered repos are already analyzed.")
         return
     
-    # Mark repos to analyze as pending (only new repos or repos with --force)
+    # Mark repos to analyze as pending (only new repos or repos with --force);
+    # they are discovered together, so they share one timestamp and one transaction
+    run_timestamp = utc_timestamp()
+    db.execute("BEGIN")
     for repo in repos_to_analyze:
         registry_data = update_registry_entry(
             registry_data, 
             repo["name"], 
             repo["git_url"], 
-            "pending"
+            "pending",
+            now=run_timestamp
         )
+    db.execute("COMMIT")
     save_registry(registry_path, registry_data)
     
     repos = repos_to_analyze
+    jobs = max(1, min(args.jobs, len(repos)))
+    print(f"\nProcessing {len(repos)} repository(ies) with {jobs} worker(s)")
     
-    # Process each repository
-    for repo in repos:
-        repo_name = repo["name"]
-        repo_url = repo["git_url"]
-        
-        print(f"\n{'='*60}")
-        print(f"Processing repository: {repo_name}")
-        print(f"{'='*60}")
-        
-        # Clone location in tmp directory
-        clone_path = tmp_dir / repo_name
-        
-        # Output location for analysis results
-        analysis_output_dir = repos_dir / repo_name / "analysis"
-        analysis_output_dir.mkdir(parents=True, exist_ok=True)
-        
-        try:
-            # Clean up any existing clone directory from previous runs
-            if clone_path.exists():
-                # Use shutil.rmtree which handles permission issues better than rm -rf
-                try:
-                    shutil.rmtree(clone_path)
-                except PermissionError:
-                    # If permission denied, try with chmod first
-                    import stat
-                    import os
-                    for root, dirs, files in os.walk(clone_path):
-                        for d in dirs:
-                            os.chmod(os.path.join(root, d), stat.S_IRWXU)
-                        for f in files:
-                            os.chmod(os.path.join(root, f), stat.S_IRWXU)
-                    shutil.rmtree(clone_path)
-            
-            # Clone the repository
-            print(f"\nCloning {repo_url} to {clone_path}")
-            subprocess.run(
-                ["git", "clone", repo_url, str(clone_path)],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            print(f"Repository cloned successfully")
-            
-            # Mark repository as running before Transform execution
-            registry_data = update_registry_entry(
-                registry_data,
-                repo_name,
-                repo_url,
-                "running",
-                language="unknown"
-            )
-            save_registry(registry_path, registry_data)
-            
-            # Run Transform analysis in non-interactive mode
-            # EXECUTION-PLANE: This is the heavy Transform execution (stable-runner only)
-            transformation_name = "AWS/early-access-comprehensive-codebase-analysis"
-            print(f"\nRunning Transform analysis on {repo_name}")
-            print(f"Using transformation: {transformation_name}")
-            
-            # Define log file path for Transform output
-            log_file_path = repos_dir / f"{repo_name}_transform.log"
-            print(f"Streaming output to {log_file_path.name}...")
-            
-            # Stream output directly to disk (bypasses shell pipe buffer)
-            with open(log_file_path, "w") as log_file:
-                subprocess.run(
-                    [
-                        "atx", "custom", "def", "exec",
-                        "-n", transformation_name,
-                        "-p", str(clone_path),
-                        "-x",  # Non-interactive mode
-                        "-t"   # Trust all tools
-                    ],
-                    check=True,
-                    cwd=str(clone_path),
-                    stdout=log_file,          # Direct stream to disk (no RAM buffer)
-                    stderr=subprocess.STDOUT  # Merge errors into same file
-                )
-            
-            print(f"Transform analysis completed. Logs saved to {log_file_path.name}")
-            transform_succeeded = True
-            
-        except subprocess.CalledProcessError:
-            # Transform process exited with error - but may have generated output
-            # Check for outputs before marking as failed (output-aware, not exit-code-only)
-            transform_succeeded = False
-            print(f"\nTransform process exited with error. Checking for generated output...", file=sys.stderr)
-        except Exception as e:
-            # Unexpected error - check for outputs anyway
-            transform_succeeded = False
-            print(f"\nUnexpected error during Transform execution: {e}. Checking for generated output...", file=sys.stderr)
-            
-        finally:
-            # OUTPUT-AWARE: Check for success using multiple indicators (logs + files)
-            # This runs regardless of process exit code - always check for outputs
-            is_success, confidence, success_details = check_transform_success(clone_path, log_file_path)
-            
-            # Copy ALL Transform-generated output before cleanup (always run, even on errors)
-            transform_output_folders = [
-                ".aws",
-                "Documentation",
-                ".atx",
-                "transform_output",
-                "analysis_output"
+    # Process repositories concurrently; registry mutations are serialized by the lock
+    registry_lock = threading.Lock()
+    cloner = PipelinedCloner(repos, tmp_dir)
+    failed_repos = []
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(process_repo, repo, tmp_dir, repos_dir, registry_path, registry_data, registry_lock, cloner)
+                for repo in repos
             ]
-            
-            copied_count = 0
-            if clone_path.exists():
-                print(f"\nCopying Transform-generated output...")
-                for item in clone_path.iterdir():
-                    if item.name == ".git":
-                        continue
-                    
-                    if item.name in transform_output_folders or item.name.startswith(".aws"):
-                        dest_item = analysis_output_dir / item.name
-                        try:
-                            if item.is_dir():
-                                shutil.copytree(item, dest_item, dirs_exist_ok=True)
-                            else:
-                                shutil.copy2(item, dest_item)
-                            copied_count += 1
-                            print(f"Copied {item.name}/")
-                        except Exception as e:
-                            print(f"Warning: Could not copy {item.name}: {e}", file=sys.stderr)
-                
-                if copied_count == 0:
-                    print(f"Warning: No Transform output folders found.")
-            
-            # Determine final status based on outputs + logs, NOT just exit code
-            if is_success:
-                # Analysis succeeded (determined by outputs/logs, even if process errored)
-                output_list = ', '.join(success_details['outputs_found']) if success_details['outputs_found'] else 'none'
-                notes_parts = [f"Analysis completed (confidence: {confidence}). Outputs: {output_list}"]
-                
-                if success_details['log_success_message']:
-                    notes_parts.append("Log confirms successful completion")
-                if not transform_succeeded:
-                    notes_parts.append("Process exit code indicated error, but outputs confirm success")
-                
-                registry_data = update_registry_entry(
-                    registry_data,
-                    repo_name,
-                    repo_url,
-                    "analyzed",
-                    language="unknown",
-                    notes=" | ".join(notes_parts)
-                )
-                save_registry(registry_path, registry_data)
-                print(f"\n✅ Analysis succeeded: Outputs validated (exit code ignored due to successful completion)")
-            elif transform_succeeded:
-                # Process succeeded but outputs don't meet success criteria
-                registry_data = update_registry_entry(
-                    registry_data,
-                    repo_name,
-                    repo_url,
-                    "analyzed",
-                    language="unknown",
-                    notes=f"Process completed but limited outputs found. Outputs: {', '.join(success_details['outputs_found']) or 'none'}"
-                )
-                save_registry(registry_path, registry_data)
-                print(f"\n⚠️  Analysis completed with limited outputs")
-            else:
-                # Real failure: no outputs and process failed
-                missing_outputs = ', '.join(success_details['outputs_missing']) if success_details['outputs_missing'] else 'all'
-                registry_data = update_registry_entry(
-                    registry_data,
-                    repo_name,
-                    repo_url,
-                    "failed",
-                    language="unknown",
-                    notes=f"Transform execution failed. Missing outputs: {missing_outputs}. Check {repos_dir.name}/{repo_name}_transform.log"
-                )
-                save_registry(registry_path, registry_data)
-                print(f"\n❌ Error: Failed to process {repo_name}. Check {repos_dir.name}/{repo_name}_transform.log", file=sys.stderr)
-            
-            # Delete the cloned repository after copying (always run cleanup)
-            if clone_path.exists():
-                print(f"\nDeleting cloned repository at {clone_path}")
-                try:
-                    shutil.rmtree(clone_path)
-                    print(f"Cleanup complete")
-                except (PermissionError, OSError) as e:
-                    print(f"Warning: Could not fully delete {clone_path}: {e}", file=sys.stderr)
-                    print(f"Cleanup partial - some files may remain")
-            
-            # Exit with error only if truly failed (no outputs, no log success)
-            if not is_success and not transform_succeeded:
-                sys.exit(1)
+            for future in as_completed(futures):
+                repo_name, status, notes = future.result()
+                if status == "failed":
+                    failed_repos.append(repo_name)
+    finally:
+        # Export the registry YAML once more, even if a worker raised
+        save_registry(registry_path, registry_data)
+        db.close()
     
     print(f"\n{'='*60}")
     print(f"Phase 1 analysis complete for {len(repos)} repository(ies)")
     print(f"{'='*60}")
+    
+    # Exit with error only if a repo truly failed (no outputs, no log success)
+    if failed_repos:
+        print(f"Failed: {', '.join(failed_repos)}", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
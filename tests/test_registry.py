@@ -0,0 +1,99 @@
+"""Round-trip checks for the analysis registry (YAML <-> SQLite working copy)."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import yaml
+
+import run_phase1_analysis as phase1
+
+
+REGISTRY_YAML = """\
+schema: 1
+repos:
+- repo_name: alpha
+  git_url: https://example.com/alpha.git
+  owner: team-x
+  language: java
+  analysis_status: pending
+  analysis_date: '2026-01-01T00:00:00+00:00'
+- repo_name: beta
+  git_url: https://example.com/beta.git
+  language: unknown
+  analysis_status: analyzed
+  analysis_date: '2026-01-01T00:00:00+00:00'
+  notes: done
+maintainers:
+- someone
+"""
+
+
+class RegistryRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.registry_path = Path(self.tmp.name) / "analysis_registry.yaml"
+        self.registry_path.write_text(REGISTRY_YAML)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_once(self, status):
+        """Load, update alpha and save, like one run of the script."""
+        registry_data = phase1.load_registry(self.registry_path)
+        phase1.update_registry_entry(
+            registry_data, "alpha", "https://example.com/alpha.git", status, now="2026-02-01T00:00:00+00:00"
+        )
+        phase1.save_registry(self.registry_path, registry_data)
+        registry_data["_db"].close()
+
+    def read_yaml(self):
+        with open(self.registry_path) as f:
+            return yaml.safe_load(f)
+
+    def test_extra_fields_survive_database_round_trip(self):
+        self.run_once("running")
+        # Second run loads from the database, since the YAML is the file it wrote
+        db = phase1.open_registry_db(self.registry_path)
+        self.assertEqual(phase1.get_registry_meta(db, "yaml_stamp"), phase1.registry_file_stamp(self.registry_path))
+        db.close()
+        self.run_once("analyzed")
+
+        data = self.read_yaml()
+        self.assertEqual(list(data), ["schema", "repos", "maintainers"])
+        self.assertEqual(data["maintainers"], ["someone"])
+        alpha, beta = data["repos"]
+        self.assertEqual(
+            list(alpha),
+            ["repo_name", "git_url", "owner", "language", "analysis_status", "analysis_date"]
+        )
+        self.assertEqual(alpha["owner"], "team-x")
+        self.assertEqual(alpha["analysis_status"], "analyzed")
+        self.assertEqual(beta["notes"], "done")
+
+    def test_database_reseeded_after_yaml_edit(self):
+        self.run_once("running")
+        edited = self.registry_path.read_text().replace("team-x", "team-y")
+        self.registry_path.write_text(edited)
+        # Make sure the edit is visible even on coarse mtime filesystems
+        st = self.registry_path.stat()
+        os.utime(self.registry_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        registry_data = phase1.load_registry(self.registry_path)
+        registry_data["_db"].close()
+        self.assertEqual(registry_data["_index"]["alpha"]["owner"], "team-y")
+
+    def test_analyzed_lookup_uses_database(self):
+        registry_data = phase1.load_registry(self.registry_path)
+        db = registry_data["_db"]
+        analyzed = {name for (name,) in db.execute("SELECT repo_name FROM repos WHERE analysis_status = 'analyzed'")}
+        db.close()
+        self.assertEqual(analyzed, {"beta"})
+
+
+if __name__ == "__main__":
+    unittest.main()